@@ -1,13 +1,15 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from typing import Any, List, Dict, Optional, Set, Tuple
-from dataclasses import dataclass
+from typing import Any, Iterator, List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass, field
 import itertools
 from heapq import heappush, heappop
 from collections import deque, defaultdict
 import math
 import logging
 
+import numpy as np
+
 router = APIRouter()
 
 # Add new model for cable update request
@@ -25,7 +27,8 @@ async def update_cable_length(request: CableUpdateRequest):
     by calling the optimize-paths endpoint again with updated cable data.
     """
     try:
-        print(f"[CABLE UPDATE] Received request to update cable {request.cableLabel or f'{request.source}-{request.target}'} to length {request.newLength}")
+        logger.info("[CABLE UPDATE] Updating cable %s to length %s",
+                    request.cableLabel or f"{request.source}-{request.target}", request.newLength)
         
         return {
             "success": True,
@@ -35,8 +38,7 @@ async def update_cable_length(request: CableUpdateRequest):
     
     except Exception as ex:
         import traceback
-        print("\n=== ERROR in update_cable_length ===")
-        print(traceback.format_exc())
+        logger.error("Error in update_cable_length:\n%s", traceback.format_exc())
         raise HTTPException(500, f"Error updating cable length: {ex}")
 
 # -------------------------------------------------------------
@@ -178,10 +180,18 @@ class RoutingResponse(BaseModel):
     problematicCables: List[ProblematicCable] = []
     levelSummaries: Dict[str, DebugInfo] = {}
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PathPoint:
     x: int
     y: int
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # PathPoints key pair_routes/adjacency dicts millions of times, so
+        # compute the hash once instead of re-hashing (x, y) on every lookup.
+        # Frozen because instances are interned via _point_pool: mutating a
+        # shared point would silently corrupt every dict/set keyed by it.
+        object.__setattr__(self, "_hash", hash((self.x, self.y)))
 
     def __eq__(self, other):
         if not isinstance(other, PathPoint):
@@ -189,7 +199,7 @@ class PathPoint:
         return (self.x == other.x) and (self.y == other.y)
 
     def __hash__(self):
-        return hash((self.x, self.y))
+        return self._hash
     
     def __lt__(self, other):
         if not isinstance(other, PathPoint):
@@ -211,7 +221,33 @@ class PathPoint:
             return NotImplemented
         return (self.x, self.y) >= (other.x, other.y)
 
-@dataclass
+# Interning pool for grid points. The weighted graph allocates up to five
+# PathPoints per cell and is rebuilt per redCable factor; sharing one
+# (frozen) instance per coordinate keeps those builds allocation-free after
+# the first and lets dict probes hit identity-equal keys. The pool is
+# dropped whenever the grid dimensions change so it never pins more than
+# one grid's worth of points.
+_point_pool: Dict[Tuple[int, int], PathPoint] = {}
+_point_pool_dims: Optional[Tuple[int, int]] = None
+
+
+def _reset_point_pool(width: int, height: int) -> None:
+    """Clear the pool when a request arrives with a different grid size."""
+    global _point_pool_dims
+    if _point_pool_dims != (width, height):
+        _point_pool.clear()
+        _point_pool_dims = (width, height)
+
+
+def _pooled_point(x: int, y: int) -> PathPoint:
+    key = (x, y)
+    pt = _point_pool.get(key)
+    if pt is None:
+        pt = _point_pool[key] = PathPoint(x, y)
+    return pt
+
+
+@dataclass(slots=True)
 class FullComponent:
     terminals: List[PathPoint]
     steiner_points: List[PathPoint]
@@ -290,26 +326,44 @@ def _build_weighted_graph_old(width: int, height: int, walls: Set[PathPoint], tr
 # NEW: DISTANCE TRANSFORM + FASTER WEIGHT COMPUTATION
 # ============================================================
 
-def _bfs_distance_map(width: int, height: int, sources: Set[PathPoint]) -> List[List[int]]:
-    """Return a 2-D list with Manhattan distance to the closest point in *sources* using BFS."""
-    logger.debug(f"Computing distance map for {len(sources)} sources on {width}x{height} grid…")
-    # Initialise with +inf
-    dist = [[math.inf for _ in range(width)] for _ in range(height)]
-    q = deque()
-
-    for p in sources:
-        if 0 <= p.x < width and 0 <= p.y < height:
-            dist[p.y][p.x] = 0
-            q.append((p.x, p.y))
-
-    # 4-neighbour BFS
-    while q:
-        x, y = q.popleft()
-        d = dist[y][x] + 1
-        for nx, ny in ((x-1, y), (x+1, y), (x, y-1), (x, y+1)):
-            if 0 <= nx < width and 0 <= ny < height and d < dist[ny][nx]:
-                dist[ny][nx] = d
-                q.append((nx, ny))
+def _points_to_mask(width: int, height: int, points: List[Point]) -> np.ndarray:
+    """Rasterize a list of grid points into a boolean (height, width) mask."""
+    mask = np.zeros((height, width), dtype=bool)
+    if points:
+        xs = np.fromiter((p.x for p in points), dtype=np.int64, count=len(points))
+        ys = np.fromiter((p.y for p in points), dtype=np.int64, count=len(points))
+        in_bounds = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        mask[ys[in_bounds], xs[in_bounds]] = True
+    return mask
+
+
+def _bfs_distance_map(width: int, height: int, sources_mask: np.ndarray) -> np.ndarray:
+    """Return a (height, width) array with Manhattan distance to the closest set cell in *sources_mask*.
+
+    The L1 metric is separable, so instead of a cell-by-cell BFS we run
+    four vectorized relaxation sweeps (left/right along rows, then up/down
+    along columns), each a whole-row/column numpy operation. The result is
+    the exact Manhattan distance transform.
+    """
+    logger.debug(f"Computing distance map for {int(sources_mask.sum())} sources on {width}x{height} grid…")
+    if not sources_mask.any():
+        # No walls/trays on this level: every cell is infinitely far, so
+        # skip the four relaxation sweeps entirely.
+        return np.full((height, width), math.inf)
+
+    dist = np.where(sources_mask, 0.0, math.inf)
+
+    # Row sweeps: nearest source offset within each row
+    for x in range(1, width):
+        np.minimum(dist[:, x], dist[:, x - 1] + 1, out=dist[:, x])
+    for x in range(width - 2, -1, -1):
+        np.minimum(dist[:, x], dist[:, x + 1] + 1, out=dist[:, x])
+
+    # Column sweeps: combine with vertical offsets => full L1 distance
+    for y in range(1, height):
+        np.minimum(dist[y], dist[y - 1] + 1, out=dist[y])
+    for y in range(height - 2, -1, -1):
+        np.minimum(dist[y], dist[y + 1] + 1, out=dist[y])
 
     logger.debug("Distance map computed.")
     return dist
@@ -320,48 +374,78 @@ def _compute_weight(dist_wall: int, dist_tray: int, redCable: float = 1.0) -> fl
     return _heuristic_weight(dist_wall, dist_tray, redCable)
 
 
+def _weight_grid(dist_wall: np.ndarray, dist_tray: np.ndarray, red_cable: float = 1.0) -> np.ndarray:
+    """Whole-grid broadcast of *_heuristic_weight* over the distance maps.
+
+    Computes every cell weight in a handful of numpy masked operations so
+    graph construction reads weights from one array instead of calling the
+    scalar helper four times per cell.
+    """
+    safe_red = max(red_cable, 1e-3)
+
+    finite_wall = np.isfinite(dist_wall)
+    weight = np.full(dist_wall.shape, BASE_STEP_COST * safe_red)
+    weight[finite_wall & (dist_wall <= 0)] = BASE_STEP_COST * WALL_BLOCK_FACTOR * safe_red
+    for d, factor in WALL_DISTANCE_FACTORS.items():
+        weight[finite_wall & (dist_wall == d)] = BASE_STEP_COST * factor * safe_red
+
+    finite_tray = np.isfinite(dist_tray)
+    for d, factor in TRAY_DISTANCE_FACTORS.items():
+        mask = finite_tray & (dist_tray == d)
+        if d == 0:
+            np.minimum(weight, BASE_STEP_COST * factor * safe_red, out=weight, where=mask)
+        else:
+            weight[mask] *= factor
+
+    np.maximum(weight, MIN_CELL_WEIGHT, out=weight)
+    return weight
+
+
 def build_weighted_graph(
     width: int,
     height: int,
-    walls: Set[PathPoint],
-    trays: Set[PathPoint] = set(),
+    walls_mask: np.ndarray,
+    trays_mask: Optional[np.ndarray] = None,
     redCable: float = 1.0,
-    dist_wall: Optional[List[List[int]]] = None,
-    dist_tray: Optional[List[List[int]]] = None,
+    dist_wall: Optional[np.ndarray] = None,
+    dist_tray: Optional[np.ndarray] = None,
 ) -> Dict[PathPoint, List[Tuple[PathPoint, float]]]:
     """Build adjacency list where edge weights favour cells near walls.
 
-    The function now uses *distance transforms* so each weight is O(1).
-    Pass pre-computed *dist_wall* and *dist_tray* for maximum speed.
+    Walls and trays arrive as boolean (height, width) masks, so blocking
+    tests are plain array lookups. The function uses *distance transforms*
+    so each weight is O(1). Pass pre-computed *dist_wall* and *dist_tray*
+    for maximum speed.
     """
     logger.debug(f"Building weighted graph (redCable={redCable}) …")
 
+    if trays_mask is None:
+        trays_mask = np.zeros((height, width), dtype=bool)
+
     # Compute distance maps lazily if not provided
     if dist_wall is None:
-        dist_wall = _bfs_distance_map(width, height, walls)
+        dist_wall = _bfs_distance_map(width, height, walls_mask)
     if dist_tray is None:
-        dist_tray = _bfs_distance_map(width, height, trays)
+        dist_tray = _bfs_distance_map(width, height, trays_mask)
 
+    weight_grid = _weight_grid(dist_wall, dist_tray, redCable)
+
+    _reset_point_pool(width, height)
     graph: Dict[PathPoint, List[Tuple[PathPoint, float]]] = {}
 
     for x in range(width):
         for y in range(height):
-            p = PathPoint(x, y)
-            if p in walls:
+            if walls_mask[y, x]:
                 continue  # Impassable
-
-            weight_here_wall = dist_wall[y][x]
-            weight_here_tray = dist_tray[y][x]
+            p = _pooled_point(x, y)
 
             neighbors: List[Tuple[PathPoint, float]] = []
             for nx, ny in ((x-1, y), (x+1, y), (x, y-1), (x, y+1)):
                 if 0 <= nx < width and 0 <= ny < height:
-                    np = PathPoint(nx, ny)
-                    if np in walls:
+                    if walls_mask[ny, nx]:
                         continue
 
-                    w = _compute_weight(dist_wall[ny][nx], dist_tray[ny][nx], redCable)
-                    neighbors.append((np, w))
+                    neighbors.append((_pooled_point(nx, ny), weight_grid[ny, nx]))
 
             graph[p] = neighbors
 
@@ -376,22 +460,25 @@ def dijkstra_path(start: PathPoint, end: PathPoint,
     """
     if start not in graph or end not in graph:
         return None
-    
+
+    # Trivial case: no search needed when both endpoints coincide
+    if start == end:
+        return (0.0, [start])
+
     # Priority queue: (cost, counter, current_point)
     counter = itertools.count()
     heap = [(0.0, next(counter), start)]
     distances = {start: 0.0}
     came_from = {start: None}
-    visited = set()
 
     while heap:
         current_cost, _, current = heappop(heap)
-        
-        if current in visited:
+
+        # skip stale heap entries instead of maintaining a separate
+        # visited set (one dict probe instead of check+add per node)
+        if current_cost != distances[current]:
             continue
-            
-        visited.add(current)
-        
+
         if current == end:
             # Reconstruct path
             path = []
@@ -401,18 +488,16 @@ def dijkstra_path(start: PathPoint, end: PathPoint,
                 node = came_from[node]
             path.reverse()
             return (current_cost, path)
-        
+
         for neighbor, edge_weight in graph[current]:
-            if neighbor in visited:
-                continue
-                
             new_cost = current_cost + edge_weight
-            
-            if neighbor not in distances or new_cost < distances[neighbor]:
+
+            known = distances.get(neighbor)
+            if known is None or new_cost < known:
                 distances[neighbor] = new_cost
                 came_from[neighbor] = current
                 heappush(heap, (new_cost, next(counter), neighbor))
-    
+
     return None
 
 # -----------------------------------------------------------
@@ -433,14 +518,21 @@ def _dijkstra_to_targets(
     if not target_set:
         return {}
 
+    results: Dict[PathPoint, Tuple[float, List[PathPoint]]] = {}
+
+    # Trivial case: the source itself may be one of the targets
+    if source in target_set:
+        results[source] = (0.0, [source])
+        if len(target_set) == 1:
+            return results
+
     counter = itertools.count()
     heap: List[Tuple[float, int, PathPoint]] = [(0.0, next(counter), source)]
     distances = {source: 0.0}
     came_from: Dict[PathPoint, Optional[PathPoint]] = {source: None}
 
-    results: Dict[PathPoint, Tuple[float, List[PathPoint]]] = {}
-
     targets_remaining = set(target_set)
+    targets_remaining.discard(source)
 
     while heap and targets_remaining:
         current_cost, _, current = heappop(heap)
@@ -484,8 +576,9 @@ def build_mst_lazy(
     if not terminals:
         return [], {}
 
-    print(
-        f"Building MST lazily: {len(terminals)} terminals – at most {len(terminals)} Dijkstra runs instead of {len(terminals)*(len(terminals)-1)//2}."
+    logger.debug(
+        "Building MST lazily: %d terminals – at most %d Dijkstra runs instead of %d.",
+        len(terminals), len(terminals), len(terminals) * (len(terminals) - 1) // 2
     )
 
     visited: Set[PathPoint] = set()
@@ -499,9 +592,12 @@ def build_mst_lazy(
     start = terminals[0]
     visited.add(start)
 
+    # Frontier bookkeeping: keep the unvisited terminals as a live set so
+    # each round shrinks it in O(1) instead of rescanning all terminals.
+    unvisited: Set[PathPoint] = set(terminals[1:])
+
     # initial distances from start to all others
-    targets = set(terminals[1:])
-    for tgt, (cost, path) in _dijkstra_to_targets(start, targets, graph).items():
+    for tgt, (cost, path) in _dijkstra_to_targets(start, unvisited, graph).items():
         pair_routes[(start, tgt)] = (cost, path)
         pair_routes[(tgt, start)] = (cost, list(reversed(path)))
         heappush(edge_heap, (cost, next(counter), start, tgt))
@@ -521,16 +617,17 @@ def build_mst_lazy(
 
         mst_edges.append((u, v))
         visited.add(v)
+        unvisited.discard(v)
 
         # Dijkstra from newly visited terminal to all yet-unvisited terminals
-        remaining = set(t for t in terminals if t not in visited)
-        if remaining:
-            for tgt, (cost_vt, path_vt) in _dijkstra_to_targets(v, remaining, graph).items():
+        if unvisited:
+            for tgt, (cost_vt, path_vt) in _dijkstra_to_targets(v, unvisited, graph).items():
                 pair_routes[(v, tgt)] = (cost_vt, path_vt)
                 pair_routes[(tgt, v)] = (cost_vt, list(reversed(path_vt)))
                 heappush(edge_heap, (cost_vt, next(counter), v, tgt))
 
-    print(f"Lazy MST completed with {len(mst_edges)} edges and {len(pair_routes)//2} unique pair routes computed.")
+    logger.debug("Lazy MST completed with %d edges and %d unique pair routes computed.",
+                 len(mst_edges), len(pair_routes) // 2)
 
     return mst_edges, pair_routes
 
@@ -562,7 +659,7 @@ def precompute_machine_pairs(terminals: List[PathPoint],
     """
     pair_routes = {}
     n = len(terminals)
-    print(f"Precomputing routes for {n} terminals with wall-aware weights...")
+    logger.debug("Precomputing routes for %d terminals with wall-aware weights...", n)
     
     for i in range(n):
         for j in range(i+1, n):
@@ -574,7 +671,7 @@ def precompute_machine_pairs(terminals: List[PathPoint],
                 pair_routes[(pA, pB)] = (cost, route)
                 pair_routes[(pB, pA)] = (cost, list(reversed(route)))
     
-    print(f"Successfully computed {len(pair_routes)} pairwise routes")
+    logger.debug("Successfully computed %d pairwise routes", len(pair_routes))
     return pair_routes
 
 def find_wall_aware_mst(terminals: List[PathPoint],
@@ -582,33 +679,40 @@ def find_wall_aware_mst(terminals: List[PathPoint],
                        ) -> List[Tuple[PathPoint, PathPoint]]:
     """
     Prim's MST on weighted Dijkstra edges from pair_routes.
+
+    Costs are collected once into a dense numpy matrix so the per-step
+    "cheapest edge to an unvisited terminal" selection is a vectorized
+    argmin instead of rescanning every terminal per extraction.
     """
-    if not terminals:
+    n = len(terminals)
+    if n <= 1:
         return []
 
-    visited = set()
-    mst_edges = []
-    visited.add(terminals[0])
-    heap = []
-    counter = itertools.count()
+    cost = np.full((n, n), np.inf)
+    for i in range(n):
+        ti = terminals[i]
+        for j in range(i + 1, n):
+            route = pair_routes.get((ti, terminals[j]))
+            if route is not None:
+                cost[i, j] = cost[j, i] = route[0]
 
-    # Initialize edges from the first terminal
-    for t in terminals[1:]:
-        if (terminals[0], t) in pair_routes:
-            cost = pair_routes[(terminals[0], t)][0]
-            heappush(heap, (cost, next(counter), terminals[0], t))
+    best = cost[0].copy()
+    best_parent = np.zeros(n, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[0] = True
 
-    while len(visited) < len(terminals) and heap:
-        cost, _, u, v = heappop(heap)
-        if v in visited:
-            continue
-        visited.add(v)
-        mst_edges.append((u, v))
-        for w in terminals:
-            if w not in visited:
-                if (v, w) in pair_routes:
-                    dw = pair_routes[(v, w)][0]
-                    heappush(heap, (dw, next(counter), v, w))
+    mst_edges = []
+    for _ in range(n - 1):
+        frontier = np.where(in_tree, np.inf, best)
+        v = int(frontier.argmin())
+        if not np.isfinite(frontier[v]):
+            break  # remaining terminals unreachable
+        in_tree[v] = True
+        mst_edges.append((terminals[int(best_parent[v])], terminals[v]))
+
+        improves = cost[v] < best
+        best = np.where(improves, cost[v], best)
+        best_parent = np.where(improves, v, best_parent)
 
     return mst_edges
 
@@ -663,34 +767,38 @@ def find_promising_terminal_groups(terminals: List[PathPoint],
     for net_terminals in network_groups.values():
         if len(net_terminals) < 3:
             continue
-            
+
+        # Collect the pairwise Dijkstra costs into one numpy matrix so the
+        # "5 closest neighbours" query per terminal is an argsort on a row
+        # instead of building and sorting a Python list each time.
+        term_list = list(net_terminals)
+        n = len(term_list)
+        dist_matrix = np.full((n, n), np.inf)
+        for i in range(n):
+            ti = term_list[i]
+            for j in range(i + 1, n):
+                route = pair_routes.get((ti, term_list[j]))
+                if route is not None:
+                    dist_matrix[i, j] = dist_matrix[j, i] = route[0]
+
         # Find terminals that form L or T shapes
-        for t1 in net_terminals:
-            nearby = []
-            # Find terminals close to t1
-            for t2 in net_terminals:
-                if t1 == t2:
-                    continue
-                if (t1, t2) in pair_routes:
-                    dist, _ = pair_routes[(t1, t2)]
-                    nearby.append((dist, t2))  # tuple of (distance, point)
-            
-            # Sort by distance only (first element of tuple)
-            nearby.sort(key=lambda x: x[0])  # Sort by distance
-            nearby = nearby[:5]  # Consider only 5 closest neighbors
-            
+        for i, t1 in enumerate(term_list):
+            row_order = np.argsort(dist_matrix[i], kind="stable")
+            nearby = [term_list[j] for j in row_order[:6]
+                      if j != i and np.isfinite(dist_matrix[i, j])][:5]
+
             # Look for L-shapes (3 terminals)
-            for _, t2 in nearby:
-                for _, t3 in nearby:
+            for t2 in nearby:
+                for t3 in nearby:
                     if t2 == t3:
                         continue
                     # Check if they form roughly an L-shape
                     if (abs(t1.x - t2.x) + abs(t2.y - t3.y) < 
                         abs(t1.x - t3.x) + abs(t2.y - t1.y)):
                         promising_groups.append([t1, t2, t3])
-                        
+
                     # Look for potential T or H shapes (4 terminals)
-                    for _, t4 in nearby:
+                    for t4 in nearby:
                         if t4 in (t1, t2, t3):
                             continue
                         # Check for T-shape potential
@@ -709,7 +817,7 @@ def find_promising_terminal_groups(terminals: List[PathPoint],
             if len(unique_groups) >= max_groups:
                 break
 
-    print(f"\nFound {len(unique_groups)} promising terminal groups")
+    logger.debug("Found %d promising terminal groups", len(unique_groups))
     return unique_groups
 
 def generate_all_components(
@@ -719,8 +827,8 @@ def generate_all_components(
     weighted_graph: Dict[PathPoint, List[Tuple[PathPoint, float]]],
     width: int,
     height: int,
-    walls: Set[PathPoint],
-    trays:Set[PathPoint],
+    dist_wall: np.ndarray,
+    dist_tray: np.ndarray,
     cables: List[Cable] = None,
     machines: Dict[str, Machine] = None
 ) -> List[FullComponent]:
@@ -757,40 +865,54 @@ def generate_all_components(
     # Helper: accurate gain calculation for a component
     # ------------------------------------------------------------
 
-    def component_gain(connections: List[Tuple[PathPoint, PathPoint]], group_set: Set[PathPoint]) -> Tuple[float, float, float]:
+    weight_grid = _weight_grid(dist_wall, dist_tray)
+
+    # Canonical lookup of MST edges so per-group scans probe the handful of
+    # terminal pairs in the group instead of walking every MST edge twice
+    # (once for the lower bound, once again inside the gain computation).
+    edge_lookup = {_edge_key(u, v): pair_routes[(u, v)] for (u, v) in mst_edges}
+
+    def group_edge_entries(group_set: Set[PathPoint]) -> List[Tuple[float, List[PathPoint]]]:
+        """(cost, path) of MST edges with both endpoints inside the group."""
+        entries = []
+        for u, v in itertools.combinations(group_set, 2):
+            entry = edge_lookup.get(_edge_key(u, v))
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    def merged_path_cost(paths: List[List[PathPoint]]) -> float:
+        """Sum cell weights over the union of path cells.
+
+        Each path's first point is skipped to avoid double counting
+        endpoints; shared cells are deduplicated by packing coordinates
+        and taking np.unique, then the weights come from one fancy-index
+        sum over the precomputed weight grid.
+        """
+        total_pts = sum(max(0, len(path) - 1) for path in paths)
+        if total_pts == 0:
+            return 0.0
+        packed = np.unique(np.fromiter(
+            ((p.x << 32) | p.y for path in paths for p in path[1:]),
+            dtype=np.int64, count=total_pts
+        ))
+        return float(weight_grid[packed & 0xFFFFFFFF, packed >> 32].sum())
+
+    def component_gain(connections: List[Tuple[PathPoint, PathPoint]],
+                       group_entries: List[Tuple[float, List[PathPoint]]]) -> Tuple[float, float, float]:
         """Return (removed_cost, added_cost, gain) for the component."""
-        # 1) cost removed - use merged cost to avoid double counting
-        old_paths = []
-        for (u, v) in mst_edges:
-            if u in group_set and v in group_set:
-                old_paths.append(pair_routes[(u, v)][1])
-        
-        # Calculate merged cost to avoid double-counting shared cells
-        visited = set()
-        removed = 0.0
-        for path in old_paths:
-            for p in path[1:]:  # Skip first point to avoid double counting endpoints
-                if p not in visited:
-                    visited.add(p)
-                    removed += calculate_cell_weight(p.x, p.y, width, height, walls, trays)
-
-        # 2) cost added - also use merged cost to avoid double counting
+        # 1) cost removed - merged over shared cells to avoid double counting
+        removed = merged_path_cost([path for _, path in group_entries])
+
+        # 2) cost added - also merged to avoid double counting
         new_paths = []
         for (u, v) in connections:
             _, path = get_path(u, v)
             if not path:
                 return (removed, float('inf'), -float('inf'))
             new_paths.append(path)
-        
-        # Calculate merged cost for new connections
-        visited = set()
-        added = 0.0
-        for path in new_paths:
-            for p in path[1:]:  # Skip first point to avoid double counting endpoints
-                if p not in visited:
-                    visited.add(p)
-                    added += calculate_cell_weight(p.x, p.y, width, height, walls, trays)
-        
+        added = merged_path_cost(new_paths)
+
         gain_val = removed - added
         return removed, added, gain_val
 
@@ -808,62 +930,63 @@ def generate_all_components(
         if len(group) == 3:
             # Try 3-terminal component
             t1, t2, t3 = group
+
+            # Colinear triples cannot branch: the coordinate-median Steiner
+            # point degenerates onto the middle terminal, so skip them
+            # before paying for the lower-bound scans.
+            if (t2.x - t1.x) * (t3.y - t1.y) == (t3.x - t1.x) * (t2.y - t1.y):
+                continue
+
             group_set = {t1, t2, t3}
 
             # --- fast lower-bound check ----------------------------------
-            removed_lb = 0.0
-            for (u,v) in mst_edges:
-                if u in group_set and v in group_set:
-                    removed_lb += pair_routes[(u,v)][0]
+            group_entries = group_edge_entries(group_set)
+            removed_lb = sum(cost for cost, _ in group_entries)
+
+            # Flatten the group into coordinate tuples once; the span and
+            # median bounds below then work on plain ints instead of
+            # re-walking PathPoint attributes per pass.
+            gxs = (t1.x, t2.x, t3.x)
+            gys = (t1.y, t2.y, t3.y)
 
             # Simple span lower bound
-            span_lb = (max(p.x for p in group_set) - min(p.x for p in group_set)) + \
-                       (max(p.y for p in group_set) - min(p.y for p in group_set))
+            span_lb = (max(gxs) - min(gxs)) + (max(gys) - min(gys))
 
             if removed_lb - span_lb <= 0:
-                print(f"[SkipLB] 3-term span LB {[(p.x,p.y) for p in group_set]} removed={removed_lb:.1f} spanLB={span_lb:.1f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[SkipLB] 3-term span LB %s removed=%.1f spanLB=%.1f",
+                                 [(p.x, p.y) for p in group_set], removed_lb, span_lb)
                 continue
 
-            xs = sorted([t1.x, t2.x, t3.x])
-            ys = sorted([t1.y, t2.y, t3.y])
-            sx, sy = xs[1], ys[1]
-            lb_cost = (abs(sx - t1.x) + abs(sy - t1.y) +
-                       abs(sx - t2.x) + abs(sy - t2.y) +
-                       abs(sx - t3.x) + abs(sy - t3.y))
+            # Median (optimal rectilinear meeting point) lower bound
+            sx = sum(gxs) - max(gxs) - min(gxs)
+            sy = sum(gys) - max(gys) - min(gys)
+            lb_cost = (abs(sx - gxs[0]) + abs(sy - gys[0]) +
+                       abs(sx - gxs[1]) + abs(sy - gys[1]) +
+                       abs(sx - gxs[2]) + abs(sy - gys[2]))
 
             if removed_lb - lb_cost <= 0:
-                print(f"[SkipLB] 3-term group {[(p.x,p.y) for p in group_set]} removed={removed_lb:.1f} lb={lb_cost:.1f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[SkipLB] 3-term group %s removed=%.1f lb=%.1f",
+                                 [(p.x, p.y) for p in group_set], removed_lb, lb_cost)
                 continue
 
-            xs = sorted([t1.x, t2.x, t3.x])
-            ys = sorted([t1.y, t2.y, t3.y])
-            sx, sy = xs[1], ys[1]  # median
-            lb_cost = (abs(sx - t1.x) + abs(sy - t1.y) +
-                       abs(sx - t2.x) + abs(sy - t2.y) +
-                       abs(sx - t3.x) + abs(sy - t3.y))
-
-            if removed_lb - lb_cost <= 0:
-                print(f"[SkipLB] 3-term group {[(p.x,p.y) for p in group_set]} removed={removed_lb:.1f} lb={lb_cost:.1f}")
-                continue
-
-            xs = sorted([t1.x, t2.x, t3.x])
-            ys = sorted([t1.y, t2.y, t3.y])
-            sx, sy = xs[1], ys[1]  # median
             sp = PathPoint(sx, sy)
 
-            r1 = dijkstra_path(sp, t1, weighted_graph)
-            r2 = dijkstra_path(sp, t2, weighted_graph)
-            r3 = dijkstra_path(sp, t3, weighted_graph)
+            _, r1 = get_path(sp, t1)
+            _, r2 = get_path(sp, t2)
+            _, r3 = get_path(sp, t3)
             if not (r1 and r2 and r3):
                 continue
             # Compute gain properly while being robust to 2-tuple fallbacks
-            cg_result = component_gain([(sp, t1), (sp, t2), (sp, t3)], group_set)
+            cg_result = component_gain([(sp, t1), (sp, t2), (sp, t3)], group_entries)
             if len(cg_result) == 2:
                 removed_cost, added_cost = cg_result
                 gain = removed_cost - added_cost
             else:
                 removed_cost, added_cost, gain = cg_result
-            print(f"[SteinerTest] 3-term at ({sx},{sy}): removed={removed_cost:.2f}, added={added_cost:.2f}, gain={gain:.2f}")
+            logger.debug("[SteinerTest] 3-term at (%d,%d): removed=%.2f, added=%.2f, gain=%.2f",
+                         sx, sy, removed_cost, added_cost, gain)
             if gain > 0:
                 conns = [(sp, t1), (sp, t2), (sp, t3)]
                 comps.append(
@@ -880,53 +1003,60 @@ def generate_all_components(
             t1, t2, t3, t4 = group
             group_set = {t1, t2, t3, t4}
 
-            removed_lb = 0.0
-            for (u,v) in mst_edges:
-                if u in group_set and v in group_set:
-                    removed_lb += pair_routes[(u,v)][0]
+            group_entries = group_edge_entries(group_set)
+            removed_lb = sum(cost for cost, _ in group_entries)
 
             # Simple span lower bound
-            span_lb = (max(p.x for p in group_set) - min(p.x for p in group_set)) + \
-                       (max(p.y for p in group_set) - min(p.y for p in group_set))
+            gxs = (t1.x, t2.x, t3.x, t4.x)
+            gys = (t1.y, t2.y, t3.y, t4.y)
+            min_x, max_x = min(gxs), max(gxs)
+            min_y, max_y = min(gys), max(gys)
+
+            span_lb = (max_x - min_x) + (max_y - min_y)
 
             if removed_lb - span_lb <= 0:
-                print(f"[SkipLB] 4-term span LB {[(p.x,p.y) for p in group_set]} removed={removed_lb:.1f} spanLB={span_lb:.1f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[SkipLB] 4-term span LB %s removed=%.1f spanLB=%.1f",
+                                 [(p.x, p.y) for p in group_set], removed_lb, span_lb)
                 continue
 
-            cx = (min(p.x for p in group_set) + max(p.x for p in group_set))//2
-            cy = (min(p.y for p in group_set) + max(p.y for p in group_set))//2
-            lb_cost = sum(abs(p.x-cx)+abs(p.y-cy) for p in group_set)
+            cx = (min_x + max_x) // 2
+            cy = (min_y + max_y) // 2
+            lb_cost = sum(abs(x - cx) + abs(y - cy) for x, y in zip(gxs, gys))
 
             if removed_lb - lb_cost <= 0:
-                print(f"[SkipLB] 4-term group {[(p.x,p.y) for p in group_set]} removed={removed_lb:.1f} lb={lb_cost:.1f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[SkipLB] 4-term group %s removed=%.1f lb=%.1f",
+                                 [(p.x, p.y) for p in group_set], removed_lb, lb_cost)
                 continue
             
-            # Try partitioning based on geometry
+            # Try partitioning based on geometry (tuples only, no throwaway
+            # list/reversed allocations per group)
             if abs(t1.x - t2.x) < abs(t1.y - t2.y):
-                pair_groups = [(t1, t2), (t3, t4)]
+                pair_a, pair_b = (t1, t2), (t3, t4)
             else:
-                pair_groups = [(t1, t3), (t2, t4)]
-                
-            for pairs in [pair_groups, list(reversed(pair_groups))]:
-                (pA, pB), (pC, pD) = pairs  # Unpack the pairs
-                
+                pair_a, pair_b = (t1, t3), (t2, t4)
+
+            for (pA, pB), (pC, pD) in ((pair_a, pair_b), (pair_b, pair_a)):
+
                 # Create Steiner points at L-corners
                 spA = PathPoint(pA.x, pB.y)  # L-corner for first pair
                 spB = PathPoint(pC.x, pD.y)  # L-corner for second pair
                 
-                rA1 = dijkstra_path(spA, pA, weighted_graph)
-                rA2 = dijkstra_path(spA, pB, weighted_graph)
-                rB1 = dijkstra_path(spB, pC, weighted_graph)
-                rB2 = dijkstra_path(spB, pD, weighted_graph)
+                _, rA1 = get_path(spA, pA)
+                _, rA2 = get_path(spA, pB)
+                _, rB1 = get_path(spB, pC)
+                _, rB2 = get_path(spB, pD)
                 if not (rA1 and rA2 and rB1 and rB2):
                     continue
-                rAB = dijkstra_path(spA, spB, weighted_graph)
+                _, rAB = get_path(spA, spB)
                 if not rAB:
                     continue
 
                 connections = [(spA, pA), (spA, pB), (spB, pC), (spB, pD), (spA, spB)]
-                removed_cost, added_cost, gain = component_gain(connections, group_set)
-                print(f"[SteinerTest] 4-term at ({spA.x},{spA.y})/({spB.x},{spB.y}): removed={removed_cost:.2f}, added={added_cost:.2f}, gain={gain:.2f}")
+                removed_cost, added_cost, gain = component_gain(connections, group_entries)
+                logger.debug("[SteinerTest] 4-term at (%d,%d)/(%d,%d): removed=%.2f, added=%.2f, gain=%.2f",
+                             spA.x, spA.y, spB.x, spB.y, removed_cost, added_cost, gain)
                 if gain > 0:
                     comps.append(
                         FullComponent(
@@ -937,8 +1067,11 @@ def generate_all_components(
                         )
                     )
 
-    # Sort by gain as before
-    comps.sort(key=lambda c: c.gain, reverse=True)
+    # Sort by gain as before (argsort on a flat gain array instead of
+    # key-function calls per comparison)
+    if comps:
+        gains = np.fromiter((c.gain for c in comps), dtype=np.float64, count=len(comps))
+        comps = [comps[i] for i in np.argsort(-gains, kind="stable")]
     return comps
 
 # ----------------- MST UPDATE & ROUTING -----------------
@@ -978,15 +1111,19 @@ def build_mst_adjacency(mst_edges: List[Tuple[PathPoint, PathPoint]],
     Create a graph adjacency for all Dijkstra paths used by MST edges.
     If MST edge (u,v) has path p1->p2->...->pn, link them in both directions.
     """
-    adjacency = {}
+    adjacency: Dict[PathPoint, Set[PathPoint]] = defaultdict(set)
     for (u, v) in mst_edges:
-        dist_uv, path_uv = pair_routes.get((u, v), (0.0, []))
-        for i in range(len(path_uv)-1):
-            p1 = path_uv[i]
-            p2 = path_uv[i+1]
-            adjacency.setdefault(p1, set()).add(p2)
-            adjacency.setdefault(p2, set()).add(p1)
-    return adjacency
+        _, path_uv = pair_routes.get((u, v), (0.0, []))
+        for p1, p2 in zip(path_uv, path_uv[1:]):
+            adjacency[p1].add(p2)
+            adjacency[p2].add(p1)
+    # plain dict so later traversals can't create keys by accident
+    return dict(adjacency)
+
+
+def _edge_key(u: PathPoint, v: PathPoint) -> Tuple[PathPoint, PathPoint]:
+    """Canonical orientation-independent key for an undirected MST edge."""
+    return (u, v) if u <= v else (v, u)
 
 
 def _edge_step_length(u: PathPoint, v: PathPoint,
@@ -1004,11 +1141,18 @@ def _force_edge_on_tree(
     mst_edges: List[Tuple[PathPoint, PathPoint]],
     u: PathPoint,
     v: PathPoint,
-    pair_routes: Dict[Tuple[PathPoint, PathPoint], Tuple[float, List[PathPoint]]]
+    pair_routes: Dict[Tuple[PathPoint, PathPoint], Tuple[float, List[PathPoint]]],
+    edge_keys: Optional[Set[Tuple[PathPoint, PathPoint]]] = None
 ) -> Tuple[List[Tuple[PathPoint, PathPoint]], Optional[Tuple[PathPoint, PathPoint]]]:
-    """Insert edge (u,v) into MST and drop the longest edge on the induced cycle."""
+    """Insert edge (u,v) into MST and drop the longest edge on the induced cycle.
+
+    ``edge_keys`` may hold the precomputed canonical keys of ``mst_edges`` so
+    repeated callers don't rebuild the set on every invocation.
+    """
 
-    if any((edge[0] == u and edge[1] == v) or (edge[0] == v and edge[1] == u) for edge in mst_edges):
+    if edge_keys is None:
+        edge_keys = {_edge_key(a, b) for a, b in mst_edges}
+    if _edge_key(u, v) in edge_keys:
         return mst_edges, None
 
     adjacency: Dict[PathPoint, Set[PathPoint]] = defaultdict(set)
@@ -1018,11 +1162,16 @@ def _force_edge_on_tree(
 
     queue = deque([u])
     parents: Dict[PathPoint, Optional[PathPoint]] = {u: None}
-    while queue and v not in parents:
+    found = v == u
+    while queue and not found:
         current = queue.popleft()
         for nbr in adjacency[current]:
             if nbr not in parents:
                 parents[nbr] = current
+                if nbr == v:
+                    # stop at enqueue time; no need to drain the queue
+                    found = True
+                    break
                 queue.append(nbr)
 
     if v not in parents:
@@ -1044,10 +1193,8 @@ def _force_edge_on_tree(
         key=lambda edge: _edge_step_length(edge[0], edge[1], pair_routes)
     )
 
-    updated = [edge for edge in mst_edges if not (
-        (edge[0] == edge_to_remove[0] and edge[1] == edge_to_remove[1]) or
-        (edge[0] == edge_to_remove[1] and edge[1] == edge_to_remove[0])
-    )]
+    remove_key = _edge_key(*edge_to_remove)
+    updated = [edge for edge in mst_edges if _edge_key(*edge) != remove_key]
     updated.append((u, v))
     return updated, edge_to_remove
 
@@ -1058,7 +1205,8 @@ def enforce_cable_length_limits(
     cables: List[Cable],
     machines: Dict[str, Machine],
     grid_resolution: float,
-    weighted_graph: Dict[PathPoint, List[Tuple[PathPoint, float]]]
+    weighted_graph: Dict[PathPoint, List[Tuple[PathPoint, float]]],
+    parsed_lengths: Optional[Dict[str, Optional[float]]] = None
 ) -> Tuple[List[Tuple[PathPoint, PathPoint]], bool]:
     """
     Ensure every cable route can fit within the specified length by promoting direct edges when required.
@@ -1068,10 +1216,17 @@ def enforce_cable_length_limits(
         return mst_edges, False
 
     updated_mst = list(mst_edges)
+    # Canonical keys of the current tree, kept in sync below so each forced
+    # edge doesn't trigger a full rebuild inside _force_edge_on_tree.
+    edge_keys = {_edge_key(a, b) for a, b in updated_mst}
     adjusted = False
 
     for cb in cables:
-        allowed_length = _parse_length(getattr(cb, "length", None))
+        cid = cb.cableLabel or f"{cb.source}-{cb.target}"
+        if parsed_lengths is not None:
+            allowed_length = parsed_lengths.get(cid)
+        else:
+            allowed_length = _parse_length(getattr(cb, "length", None))
         if allowed_length is None or grid_resolution <= 0:
             continue
 
@@ -1106,9 +1261,11 @@ def enforce_cable_length_limits(
         if direct_steps == 0 or direct_steps > max_steps:
             continue
 
-        updated_mst, removed_edge = _force_edge_on_tree(updated_mst, src, dst, pair_routes)
+        updated_mst, removed_edge = _force_edge_on_tree(updated_mst, src, dst, pair_routes, edge_keys)
         if removed_edge is not None:
             adjusted = True
+            edge_keys.discard(_edge_key(*removed_edge))
+            edge_keys.add(_edge_key(src, dst))
             logger.info(
                 "[LENGTH] Forced direct edge %s-%s to satisfy %.2fm cable (removed %s-%s)",
                 cb.source,
@@ -1132,7 +1289,7 @@ def detect_steiner_points(mst_adjacency: Dict[PathPoint, Set[PathPoint]]) -> Set
 
 def split_path_at_steiner_points(path_uv: List[PathPoint],
                                  steiner_points: Set[PathPoint]
-                                ) -> List[List[PathPoint]]:
+                                ) -> Iterator[List[PathPoint]]:
     """
     Given a Dijkstra path from MST (u-> ... -> v),
     split it into sub-paths whenever we hit a Steiner point in the interior.
@@ -1140,8 +1297,10 @@ def split_path_at_steiner_points(path_uv: List[PathPoint],
       path = [A, ..., X, S, Y, ..., B], where S is a steiner point, yields
       [A, ..., X, S] and [S, Y, ..., B].
     If there's multiple steiner points, we keep splitting.
+
+    Sub-paths are yielded lazily, so only one segment is alive at a time
+    instead of materializing a list of lists for long MST paths.
     """
-    segments = []
     current_segment = []
     for i, p in enumerate(path_uv):
         current_segment.append(p)
@@ -1149,47 +1308,133 @@ def split_path_at_steiner_points(path_uv: List[PathPoint],
             # if p is a steiner point and not the very last point
             if p in steiner_points and i != 0:
                 # segment ends here
-                segments.append(current_segment)
+                yield current_segment
                 current_segment = [p]
         else:
             # last point => always end the final segment
-            segments.append(current_segment)
-    return segments
+            yield current_segment
+
+class _TreeRouteIndex:
+    """Parent/depth index over the MST cell adjacency for O(path_len) route queries.
+
+    The MST edges unify into one big cell-level adjacency; a single rooted BFS
+    per connected component gives parent pointers, after which any src→dst
+    route is assembled by climbing both endpoints to their lowest common
+    ancestor instead of running a fresh BFS per cable.
+    """
+
+    def __init__(self, adjacency: Dict[PathPoint, Set[PathPoint]]):
+        # kept so callers needing the raw cell adjacency (Steiner/T-junction
+        # detection) can reuse it instead of rebuilding from the edges
+        self.adjacency = adjacency
+        self.parent: Dict[PathPoint, Optional[PathPoint]] = {}
+        self.depth: Dict[PathPoint, int] = {}
+        for root in adjacency:
+            if root in self.depth:
+                continue
+            self.parent[root] = None
+            self.depth[root] = 0
+            queue = deque([root])
+            while queue:
+                current = queue.popleft()
+                for nbr in adjacency[current]:
+                    if nbr not in self.depth:
+                        self.parent[nbr] = current
+                        self.depth[nbr] = self.depth[current] + 1
+                        queue.append(nbr)
+
+    def route(self, src: PathPoint, dst: PathPoint) -> List[PathPoint]:
+        """Return the tree path src→dst, or [] if they are not connected."""
+        if src not in self.depth or dst not in self.depth:
+            return []
+
+        up_src: List[PathPoint] = [src]
+        up_dst: List[PathPoint] = [dst]
+        a, b = src, dst
+
+        # Climb the deeper endpoint until both sit at the same depth …
+        while self.depth[a] > self.depth[b]:
+            a = self.parent[a]
+            up_src.append(a)
+        while self.depth[b] > self.depth[a]:
+            b = self.parent[b]
+            up_dst.append(b)
+
+        # … then climb in lock-step until they meet at the LCA.
+        while a != b:
+            a = self.parent[a]
+            b = self.parent[b]
+            if a is None or b is None:
+                return []  # different components
+            up_src.append(a)
+            up_dst.append(b)
+
+        # up_src ends at the LCA; append the dst side in reverse (minus the LCA).
+        up_src.extend(up_dst[-2::-1])
+        return up_src
+
+
+# Only the route index for the latest MST version is worth keeping around.
+# The adjacency is built from the pair_routes *paths*, not just the edge
+# endpoints, so each entry also pins the pair_routes dict it was built from:
+# a later request with the same machine layout but different walls/trays has
+# a fresh pair_routes and must not reuse the old geometry.
+_route_index_cache: Dict[Tuple, Tuple[Dict, _TreeRouteIndex]] = {}
+
+
+def _mst_version_key(mst_edges: List[Tuple[PathPoint, PathPoint]]) -> Tuple:
+    return tuple((u.x, u.y, v.x, v.y) for u, v in mst_edges)
+
+
+def _get_route_index(mst_edges: List[Tuple[PathPoint, PathPoint]],
+                     pair_routes: Dict[Tuple[PathPoint, PathPoint], Tuple[float, List[PathPoint]]]
+                    ) -> _TreeRouteIndex:
+    key = _mst_version_key(mst_edges)
+    entry = _route_index_cache.get(key)
+    if entry is not None and entry[0] is pair_routes:
+        return entry[1]
+    _route_index_cache.clear()
+    index = _TreeRouteIndex(build_mst_adjacency(mst_edges, pair_routes))
+    # keep the pair_routes reference alive so the identity check above can
+    # never be fooled by a recycled dict
+    _route_index_cache[key] = (pair_routes, index)
+    return index
+
 
 def find_cable_route(src: PathPoint, dst: PathPoint,
                      mst_edges: List[Tuple[PathPoint, PathPoint]],
                      pair_routes: Dict[Tuple[PathPoint, PathPoint], Tuple[float, List[PathPoint]]]
                     ) -> List[Point]:
     """
-    Build MST adjacency and search from src to dst inside that adjacency.
-    Because each MST edge is a Dijkstra path, we unify them in one big adjacency.
+    Look up the src→dst route inside the MST cell adjacency.
+    Because each MST edge is a Dijkstra path, we unify them in one big adjacency;
+    the parent/depth index is built once per MST version, so each cable query
+    is just an LCA walk instead of a fresh BFS.
     """
-    adjacency = build_mst_adjacency(mst_edges, pair_routes)
+    index = _get_route_index(mst_edges, pair_routes)
+    # model_construct skips pydantic validation; coordinates come straight
+    # from already-validated grid points.
+    return [Point.model_construct(x=p.x, y=p.y) for p in index.route(src, dst)]
 
-    # If src or dst is not in adjacency, no route
-    if src not in adjacency or dst not in adjacency:
-        return []
+# ----------------- BUILDING SECTIONS -----------------
 
-    # BFS on adjacency (unweighted since we're searching in the MST structure)
-    queue = deque([src])
-    came_from = {src: None}
-    while queue:
-        current = queue.popleft()
-        if current == dst:
-            # reconstruct
-            rev_path = []
-            while current is not None:
-                rev_path.append(current)
-                current = came_from[current]
-            rev_path.reverse()
-            return [Point(x=p.x, y=p.y) for p in rev_path]
-        for nbr in adjacency[current]:
-            if nbr not in came_from:
-                came_from[nbr] = current
-                queue.append(nbr)
-    return []
+def _bloom_sig(packed: np.ndarray) -> int:
+    """64-bit Bloom signature over packed (x<<32)|y cells.
+
+    Both coordinates are mixed into the bucket (Knuth multiplicative
+    hashing) — taking the raw low bits would hash only y, making cables
+    in the same horizontal band collide on wide grids.
+    """
+    if packed.size == 0:
+        return 0
+    xs = (packed >> 32).astype(np.uint64)
+    ys = (packed & 0xFFFFFFFF).astype(np.uint64)
+    buckets = ((xs * np.uint64(2654435761)) ^ (ys * np.uint64(40503))) & np.uint64(63)
+    sig = 0
+    for v in np.unique(buckets):
+        sig |= 1 << int(v)
+    return sig
 
-# ----------------- BUILDING SECTIONS -----------------
 
 def convert_to_sections(
     grid_resolution: float ,
@@ -1206,20 +1451,18 @@ def convert_to_sections(
     3) For each MST edge path, we split at steiner points to form sub-segments.
     4) For each sub-segment, see which cables overlap it => form a Section.
     """
-    print(f"\n=== convert_to_sections DEBUG ===")
-    print(f"📥 Input: {len(cables)} cables, {len(networks)} networks, {len(final_mst)} MST edges")
-    
-    # Debug networks
-    print(f"📊 Networks received:")
-    for i, net in enumerate(networks):
-        functions = net.get("functions", [])
-        print(f"  Network {i+1}: '{net.get('name')}' → functions: {functions}")
-    
-    # 1) MST adjacency
-    mst_adjacency = build_mst_adjacency(final_mst, pair_routes)
+    logger.debug("convert_to_sections: %d cables, %d networks, %d MST edges",
+                 len(cables), len(networks), len(final_mst))
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, net in enumerate(networks):
+            logger.debug("  Network %d: '%s' -> functions: %s",
+                         i + 1, net.get("name"), net.get("functions", []))
+
+    # 1) MST adjacency (shared with the cable-route index cache)
+    mst_adjacency = _get_route_index(final_mst, pair_routes).adjacency
     # 2) Steiner points
     steiner_points_set = detect_steiner_points(mst_adjacency)
-    print(f"🔹 Detected {len(steiner_points_set)} Steiner points")
+    logger.debug("Detected %d Steiner points", len(steiner_points_set))
 
     # We'll soon need Dijkstra-based cable routes:
     cable_routes = {}
@@ -1229,151 +1472,206 @@ def convert_to_sections(
     def calc_length(points: List[Point]) -> float:
         return (len(points)-1) * grid_resolution if len(points)>1 else 0.0
 
+    # Cables sharing an endpoint pair reuse one route lookup; the cached
+    # route is stored in canonical orientation and reversed on demand.
+    route_by_pair: Dict[Tuple[PathPoint, PathPoint], List[Point]] = {}
+
     for cb in cables:
         cid = cb.cableLabel or f"{cb.source}-{cb.target}"
         spt = PathPoint(machines[cb.source].x, machines[cb.source].y)
         tpt = PathPoint(machines[cb.target].x, machines[cb.target].y)
-        route = find_cable_route(spt, tpt, final_mst, pair_routes)
+
+        if spt == tpt:
+            cable_routes[cid] = [Point.model_construct(x=spt.x, y=spt.y)]
+            cable_lengths[cid] = 0.0
+            continue
+
+        key = _edge_key(spt, tpt)
+        route = route_by_pair.get(key)
+        if route is None:
+            route = find_cable_route(key[0], key[1], final_mst, pair_routes)
+            route_by_pair[key] = route
+        if (spt, tpt) != key:
+            route = list(reversed(route))
         cable_routes[cid] = route
         cable_lengths[cid] = calc_length(route)
 
-    # Build a network lookup
-    network_lookup = {}
-    for net in networks:
-        for func in net.get("functions", []):
-            network_lookup[func] = net["name"]
-    
-    print(f"🔍 Network lookup table built: {len(network_lookup)} function mappings")
-    for func, net_name in network_lookup.items():
-        print(f"  '{func}' → '{net_name}'")
+    # Pre-compute each cable's route as a sorted packed-coordinate array plus
+    # a 64-bit Bloom signature. If a segment's signature shares no bits with
+    # a cable's, they cannot overlap (no false negatives), so the membership
+    # count is skipped.
+    cable_route_arrs: Dict[str, np.ndarray] = {}
+    cable_route_sigs: Dict[str, int] = {}
+    cable_route_boxes: Dict[str, Tuple[int, int, int, int]] = {}
+    for cid, route in cable_routes.items():
+        packed = np.unique(np.fromiter(
+            ((rp.x << 32) | rp.y for rp in route), dtype=np.int64, count=len(route)
+        ))
+        cable_route_arrs[cid] = packed
+        cable_route_sigs[cid] = _bloom_sig(packed)
+        if packed.size:
+            xs = packed >> 32
+            ys = packed & 0xFFFFFFFF
+            cable_route_boxes[cid] = (int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max()))
+        else:
+            cable_route_boxes[cid] = (0, 0, -1, -1)  # empty box, overlaps nothing
+
+    # Build a network lookup in one pass
+    network_lookup = {
+        func: net["name"]
+        for net in networks
+        for func in net.get("functions", [])
+    }
+
+    logger.debug("Network lookup table built: %d function mappings", len(network_lookup))
 
-    # Group cables by network
-    grouped = {}
+    # Group cables by network in a single pass. Each entry keeps the
+    # (cable_id, cable) pair so the hot overlap loop below never recomputes
+    # the id string per segment.
+    grouped: Dict[str, List[Tuple[str, Cable]]] = defaultdict(list)
     cables_without_network = []
-    
-    print(f"🔗 Processing {len(cables)} cables for network grouping:")
+
     for c in cables:
         cable_id = c.cableLabel or f"{c.source}-{c.target}"
         cable_func = c.cableFunction
         net_name = network_lookup.get(cable_func)
-        
-        print(f"  📌 Cable '{cable_id}': function='{cable_func}' → network='{net_name}'")
-        
+
         if not net_name:
             cables_without_network.append((cable_id, cable_func))
-            print(f"    ⚠️  SKIPPED: No network found for function '{cable_func}'")
+            logger.debug("Cable '%s' skipped: no network for function '%s'", cable_id, cable_func)
             continue
-            
-        grouped.setdefault(net_name, []).append(c)
-        print(f"    ✅ Added to network '{net_name}'")
 
-    print(f"\n📈 Network grouping results:")
-    print(f"  🎯 {len(grouped)} networks with cables:")
-    for net_name, net_cables in grouped.items():
-        cable_ids = [c.cableLabel or f"{c.source}-{c.target}" for c in net_cables]
-        print(f"    '{net_name}': {len(net_cables)} cables → {cable_ids}")
-    
-    if cables_without_network:
-        print(f"  ❌ {len(cables_without_network)} cables WITHOUT networks:")
-        for cable_id, func in cables_without_network:
-            print(f"    '{cable_id}' (function: '{func}')")
+        grouped[net_name].append((cable_id, c))
+        logger.debug("Cable '%s' (function '%s') added to network '%s'", cable_id, cable_func, net_name)
+
+    logger.debug("Network grouping: %d networks with cables, %d cables without a network",
+                 len(grouped), len(cables_without_network))
 
     sections = []
 
-    # 3) For each MST edge, get Dijkstra path & split:
+    # 3) Split every MST edge into sub-segments ONCE and index them with
+    # their packed coordinate arrays and Bloom signatures. Previously this
+    # splitting and packing was redone for every network.
     total_mst_segments = 0
     total_cable_overlaps = 0
-    
-    print(f"\n🧩 Processing MST edges for section creation:")
-    for net_name, net_cables in grouped.items():
-        print(f"  🌐 Processing network '{net_name}' with {len(net_cables)} cables")
-        
-        for edge_idx, (u, v) in enumerate(final_mst):
-            dist_uv, path_uv = pair_routes.get((u,v), (0.0, []))
-            if not path_uv:
-                print(f"    ⚠️  Edge {edge_idx+1}: No path found for {u} → {v}")
-                continue
 
-            print(f"    🔗 Edge {edge_idx+1}: {u} → {v} (path length: {len(path_uv)} points)")
+    segment_index: List[Tuple[List[Point], np.ndarray, int, Tuple[int, int, int, int]]] = []
 
-            # Split the Dijkstra path at internal Steiner points
-            sub_paths = split_path_at_steiner_points(path_uv, steiner_points_set)
-            total_mst_segments += len(sub_paths)
-            print(f"      📏 Split into {len(sub_paths)} sub-segments")
+    for edge_idx, (u, v) in enumerate(final_mst):
+        _, path_uv = pair_routes.get((u,v), (0.0, []))
+        if not path_uv:
+            logger.debug("Edge %d: no path found for %s -> %s", edge_idx + 1, u, v)
+            continue
 
-            # 4) For each sub-segment, see if it overlaps with cables in net_cables
-            for seg_idx, seg in enumerate(sub_paths):
-                pyd_points = [Point(x=p.x, y=p.y) for p in seg]
-                if len(pyd_points) < 2:
-                    print(f"        ⏭️  Sub-segment {seg_idx+1}: Too short ({len(pyd_points)} points)")
-                    continue
+        logger.debug("Edge %d: %s -> %s (path length: %d points)",
+                     edge_idx + 1, u, v, len(path_uv))
 
-                used_cables = set()
-                cable_details = {}
+        # Split the Dijkstra path at internal Steiner points (streamed,
+        # so long paths never hold all sub-segments in memory at once)
+        edge_segments = 0
 
-                # naive intersection check
-                seg_set = {(p.x, p.y) for p in pyd_points}
-                print(f"        🔍 Sub-segment {seg_idx+1}: Checking overlap with {len(net_cables)} cables")
-                
-                for c in net_cables:
-                    cid = c.cableLabel or f"{c.source}-{c.target}"
-                    route = cable_routes[cid]
-                    route_set = {(rp.x, rp.y) for rp in route}
-                    # If there's an overlap of 2+ points => consider used
-                    inter = seg_set.intersection(route_set)
-                    
-                    if len(inter) >= 2:
-                        used_cables.add(cid)
-                        cable_details[cid] = CableDetail(
-                            cableLabel=c.cableLabel,
-                            source=c.source,
-                            target=c.target,
-                            originalSource=c.originalSource,
-                            originalTarget=c.originalTarget,
-                            diameter=c.diameter,
-                            cableFunction=c.cableFunction,
-                            network=net_name,
-                            trayLevel=level_name,
-                            cableType=c.cableType,
-                            routeLength=cable_lengths[cid],
-                            length=getattr(c, 'length', None)
-                        )
-                        total_cable_overlaps += 1
-                        print(f"          ✅ Cable '{cid}': {len(inter)} overlapping points")
-                    else:
-                        print(f"          ❌ Cable '{cid}': Only {len(inter)} overlapping points (need ≥2)")
-
-                if used_cables:
-                    sec = Section(
-                        points=pyd_points,
-                        cables=used_cables,
-                        network=net_name,
-                        details=cable_details,
-                        level=level_name,
-                        strokeWidth=4 + min(len(used_cables)*0.75, 15)
-                    )
-                    sections.append(sec)
-                    print(f"          🎯 SECTION CREATED: {len(used_cables)} cables, {len(pyd_points)} points")
+        for seg_idx, seg in enumerate(split_path_at_steiner_points(path_uv, steiner_points_set)):
+            edge_segments += 1
+            total_mst_segments += 1
+            pyd_points = [Point.model_construct(x=p.x, y=p.y) for p in seg]
+            if len(pyd_points) < 2:
+                logger.debug("Sub-segment %d too short (%d points)", seg_idx + 1, len(pyd_points))
+                continue
+
+            seg_arr = np.unique(np.fromiter(
+                ((p.x << 32) | p.y for p in pyd_points), dtype=np.int64, count=len(pyd_points)
+            ))
+            seg_sig = _bloom_sig(seg_arr)
+            seg_xs = seg_arr >> 32
+            seg_ys = seg_arr & 0xFFFFFFFF
+            seg_box = (int(seg_xs.min()), int(seg_ys.min()), int(seg_xs.max()), int(seg_ys.max()))
+            segment_index.append((pyd_points, seg_arr, seg_sig, seg_box))
+
+        logger.debug("Split edge %d into %d sub-segments", edge_idx + 1, edge_segments)
+
+    # 4) For each network, see which cables overlap each indexed sub-segment
+    logger.debug("Matching networks against %d indexed sub-segments", len(segment_index))
+    for net_name, net_cables in grouped.items():
+        logger.debug("Processing network '%s' with %d cables", net_name, len(net_cables))
+
+        # One CableDetail per cable per network; sections sharing a cable
+        # reference the same object instead of rebuilding it per segment.
+        detail_by_cid = {
+            cid: CableDetail(
+                cableLabel=c.cableLabel,
+                source=c.source,
+                target=c.target,
+                originalSource=c.originalSource,
+                originalTarget=c.originalTarget,
+                diameter=c.diameter,
+                cableFunction=c.cableFunction,
+                network=net_name,
+                trayLevel=level_name,
+                cableType=c.cableType,
+                routeLength=cable_lengths[cid],
+                length=getattr(c, 'length', None)
+            )
+            for cid, c in net_cables
+        }
+
+        for pyd_points, seg_arr, seg_sig, seg_box in segment_index:
+            used_cables = set()
+            cable_details = {}
+
+            for cid, c in net_cables:
+                if not (seg_sig & cable_route_sigs[cid]):
+                    continue  # signatures disjoint => routes cannot overlap
+                cbox = cable_route_boxes[cid]
+                if (seg_box[0] > cbox[2] or seg_box[2] < cbox[0] or
+                        seg_box[1] > cbox[3] or seg_box[3] < cbox[1]):
+                    continue  # bounding boxes disjoint => no shared cells
+                # If there's an overlap of 2+ points => consider used
+                # (binary search into the pre-sorted cable array)
+                route_arr = cable_route_arrs[cid]
+                idx = np.minimum(np.searchsorted(route_arr, seg_arr), len(route_arr) - 1)
+                overlap = int((route_arr[idx] == seg_arr).sum())
+
+                if overlap >= 2:
+                    used_cables.add(cid)
+                    cable_details[cid] = detail_by_cid[cid]
+                    total_cable_overlaps += 1
+                    logger.debug("Cable '%s': %d overlapping points", cid, overlap)
                 else:
-                    print(f"          ⭕ No cables overlap this sub-segment")
+                    logger.debug("Cable '%s': only %d overlapping points (need >=2)", cid, overlap)
+
+            if used_cables:
+                sec = Section(
+                    points=pyd_points,
+                    cables=used_cables,
+                    network=net_name,
+                    details=cable_details,
+                    level=level_name,
+                    strokeWidth=4 + min(len(used_cables)*0.75, 15)
+                )
+                sections.append(sec)
+                logger.debug("Section created: %d cables, %d points", len(used_cables), len(pyd_points))
+            else:
+                logger.debug("No cables overlap this sub-segment")
+
+
+    logger.debug("convert_to_sections results: %d sections, %d MST sub-segments, %d cable overlaps, %d cables skipped (no network)",
+                 len(sections), total_mst_segments, total_cable_overlaps, len(cables_without_network))
 
-    print(f"\n📋 FINAL RESULTS:")
-    print(f"  📦 Created {len(sections)} sections")
-    print(f"  🧩 Processed {total_mst_segments} MST sub-segments") 
-    print(f"  🔗 Found {total_cable_overlaps} cable overlaps")
-    print(f"  ❌ {len(cables_without_network)} cables skipped (no network)")
-    
     if len(sections) == 0 and len(cables) > 0:
-        print(f"  🚨 WARNING: No sections created despite having {len(cables)} cables!")
-        if len(cables_without_network) == len(cables):
-            print(f"  💡 LIKELY CAUSE: All cables skipped due to missing network mappings")
+        logger.warning("No sections created despite having %d cables%s", len(cables),
+                       " (all cables skipped due to missing network mappings)"
+                       if len(cables_without_network) == len(cables) else "")
 
     return sections
 
 def calculate_hanan_grid(all_points: List[PathPoint]) -> Dict[str, List[int]]:
-    xs = sorted({p.x for p in all_points})
-    ys = sorted({p.y for p in all_points})
-    return {"xCoords": xs, "yCoords": ys}
+    if not all_points:
+        return {"xCoords": [], "yCoords": []}
+    n = len(all_points)
+    xs = np.fromiter((p.x for p in all_points), dtype=np.int64, count=n)
+    ys = np.fromiter((p.y for p in all_points), dtype=np.int64, count=n)
+    # np.unique sorts and de-duplicates in one C-level pass
+    return {"xCoords": np.unique(xs).tolist(), "yCoords": np.unique(ys).tolist()}
 
 
 
@@ -1384,11 +1682,11 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
     Dijkstra-based approach with multi-pass Steiner + T-junction detection.
     """
     try:
-        print(f"\n=== Starting Dijkstra-based Cable Path Optimization (Level: {level_name.upper()}) ===")
-        print(f"Grid: {config.width}x{config.height}")
-        print(f"Machines: {len(config.machines)}, Cables: {len(config.cables)}")
-        print(f"Walls: {len(config.walls)}, Perfs: {len(config.perforations)}")
-        print(f"Trays: {len(config.trays)}")
+        logger.info("Starting Dijkstra-based cable path optimization (level: %s): grid %dx%d, "
+                    "%d machines, %d cables, %d walls, %d perfs, %d trays",
+                    level_name, config.width, config.height, len(config.machines),
+                    len(config.cables), len(config.walls), len(config.perforations),
+                    len(config.trays))
 
         max_passes = 5
 
@@ -1400,36 +1698,44 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
             if cb.source in config.machines and cb.target in config.machines:
                 valid_cables.append(cb)
             else:
-                print(f"[INFO] Ignoring cable {cb.cableLabel or f'{cb.source}-{cb.target}'} due to missing machine(s)")
+                logger.info("Ignoring cable %s due to missing machine(s)",
+                            cb.cableLabel or f"{cb.source}-{cb.target}")
 
         config.cables = valid_cables
 
-        # Build walls set
-        walls = {PathPoint(w.x, w.y) for w in config.walls}
-        trays = {PathPoint(t.x, t.y) for t in config.trays}
-        perfs = {PathPoint(p.x, p.y) for p in config.perforations}
-        walls -= perfs  # remove perforations from the walls
-        print(walls)
-        print(trays)
+        # Parse every cable's length string once instead of per lookup below
+        parsed_lengths: Dict[str, Optional[float]] = {
+            (cb.cableLabel or f"{cb.source}-{cb.target}"): _parse_length(getattr(cb, "length", None))
+            for cb in config.cables
+        }
+
+        # Build walls/trays bitmaps; perforations punch holes in the walls.
+        # Boolean masks keep the set algebra as vectorized bitwise ops and
+        # make every downstream blocking test a plain array lookup.
+        walls_mask = _points_to_mask(config.width, config.height, config.walls)
+        trays_mask = _points_to_mask(config.width, config.height, config.trays)
+        perfs_mask = _points_to_mask(config.width, config.height, config.perforations)
+        walls_mask &= ~perfs_mask  # remove perforations from the walls
+        logger.debug("Wall cells: %d, tray cells: %d", int(walls_mask.sum()), int(trays_mask.sum()))
         # ------------------------------------------------------------
         # 1) Pre-compute distance maps & set up a lightweight graph cache
         # ------------------------------------------------------------
 
-        print("Pre-computing distance transforms …")
-        dist_wall = _bfs_distance_map(config.width, config.height, walls)
-        dist_tray = _bfs_distance_map(config.width, config.height, trays)
+        logger.debug("Pre-computing distance transforms…")
+        dist_wall = _bfs_distance_map(config.width, config.height, walls_mask)
+        dist_tray = _bfs_distance_map(config.width, config.height, trays_mask)
 
         graph_cache: Dict[float, Dict[PathPoint, List[Tuple[PathPoint, float]]]] = {}
 
         def get_graph(red: float = 1.0):
             """Return (and cache) the weighted graph for a given *redCable* factor."""
             if red not in graph_cache:
-                print(f"Creating weighted graph cache entry for redCable={red:.2f}")
+                logger.debug("Creating weighted graph cache entry for redCable=%.2f", red)
                 graph_cache[red] = build_weighted_graph(
                     config.width,
                     config.height,
-                    walls,
-                    trays=trays,
+                    walls_mask,
+                    trays_mask=trays_mask,
                     redCable=red,
                     dist_wall=dist_wall,
                     dist_tray=dist_tray,
@@ -1438,17 +1744,19 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
 
         weighted_graph = get_graph(1.0)
 
-        # 2) Collect terminals
+        # 2) Collect terminals (set mirrors the list for O(1) membership checks)
         terminals = []
+        terminal_set: Set[PathPoint] = set()
         for mid, m in config.machines.items():
             pt = PathPoint(m.x, m.y)
             terminals.append(pt)
+            terminal_set.add(pt)
 
         # 3) Build MST lazily (avoids O(M^2) Dijkstra)
-        print("\n--- PASS 0: Building Initial MST (lazy Prim) ---")
+        logger.debug("PASS 0: building initial MST (lazy Prim)")
         mst_edges, pair_routes = build_mst_lazy(terminals, weighted_graph)
         init_length = mst_total_length(mst_edges, pair_routes)
-        print(f"Initial MST distance: {init_length}")
+        logger.debug("Initial MST distance: %s", init_length)
 
         current_length = init_length
         used_steiner_points = set()
@@ -1457,14 +1765,14 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
 
         # 5) Multi-pass improvement with 3-term, 4-term components
         for pass_id in range(1, max_passes+1):
-            print(f"\n=== PASS {pass_id} ===")
+            logger.debug("=== PASS %d ===", pass_id)
             improved_any = False
             iteration_count = 0
 
             while True:
                 iteration_count += 1
-                print(f"  PASS {pass_id}, iteration {iteration_count}: generating 3- & 4-term components...")
-                print(f"    ➕ Terminals (incl. Steiner): {len(terminals)}")
+                logger.debug("PASS %d, iteration %d: generating 3- & 4-term components (%d terminals incl. Steiner)",
+                             pass_id, iteration_count, len(terminals))
 
                 comps = generate_all_components(
                     terminals, 
@@ -1473,21 +1781,21 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
                     weighted_graph,
                     config.width,
                     config.height,
-                    walls,
-                    trays,
+                    dist_wall,
+                    dist_tray,
                     cables=config.cables,
                     machines=config.machines
                 )
-                print(f"  Found {len(comps)} candidate components with gain>0.")
-                if comps:
-                    print("    Top candidate components (up to 5):")
+                logger.debug("Found %d candidate components with gain>0.", len(comps))
+                if comps and logger.isEnabledFor(logging.DEBUG):
                     for i, c in enumerate(comps[:5]):
                         term_labels = [(p.x, p.y) for p in c.terminals]
                         st_labels = [(p.x, p.y) for p in c.steiner_points]
-                        print(f"      #{i+1}: gain={c.gain:.2f}, terminals={term_labels}, steiner={st_labels}")
+                        logger.debug("  candidate #%d: gain=%.2f, terminals=%s, steiner=%s",
+                                     i + 1, c.gain, term_labels, st_labels)
 
                 if not comps:
-                    print("  No more components, stopping this pass.")
+                    logger.debug("No more components, stopping this pass.")
                     break
 
                 best_improvement = 0.0
@@ -1495,6 +1803,11 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
                 best_new_mst = None
 
                 for comp in comps:
+                    # Evaluate every positive-gain candidate: gain dedupes
+                    # shared path cells (merged_path_cost) while the MST
+                    # improvement below sums full per-edge costs, so gain is
+                    # NOT an upper bound on improvement and can't be used to
+                    # cut the loop short.
                     new_edges = update_mst_with_components(mst_edges, [comp], pair_routes, weighted_graph)
                     new_len = mst_total_length(new_edges, pair_routes)
                     improvement = current_length - new_len
@@ -1504,24 +1817,28 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
                         best_new_mst = new_edges
 
                 if best_comp and best_improvement > 0:
-                    print(f"  Accepted component with gain={best_comp.gain:.2f}, improvement={best_improvement:.2f}")
-                    print(f"    ✅ Accepted Steiner points at {[ (p.x,p.y) for p in best_comp.steiner_points ]}")
+                    logger.debug("Accepted component with gain=%.2f, improvement=%.2f; Steiner points %s",
+                                 best_comp.gain, best_improvement,
+                                 [(p.x, p.y) for p in best_comp.steiner_points])
                     mst_edges = best_new_mst
                     current_length -= best_improvement
                     used_steiner_points.update(best_comp.steiner_points)
                     # Include new Steiner points as terminals for subsequent component generation
-                    terminals.extend([sp for sp in best_comp.steiner_points if sp not in terminals])
+                    for sp in best_comp.steiner_points:
+                        if sp not in terminal_set:
+                            terminal_set.add(sp)
+                            terminals.append(sp)
                     total_comps_used += 1
                     improved_any = True
                 else:
-                    print("    😕 No component improves the MST further in this iteration.")
+                    logger.debug("No component improves the MST further in this iteration.")
                     break
 
             if improved_any:
-                print(f"Completed PASS {pass_id} with MST distance={current_length}")
+                logger.debug("Completed PASS %d with MST distance=%s", pass_id, current_length)
                 passes_used = pass_id
             else:
-                print(f"No improvement in PASS {pass_id}, stopping.")
+                logger.debug("No improvement in PASS %d, stopping.", pass_id)
                 break
 
         # Enforce cable length limits before final accounting
@@ -1532,7 +1849,8 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
             config.cables,
             config.machines,
             grid_resolution,
-            weighted_graph
+            weighted_graph,
+            parsed_lengths
         )
         if length_adjusted:
             current_length = mst_total_length(mst_edges, pair_routes)
@@ -1542,22 +1860,23 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
         if init_length > 0:
             improvement_pct = 100*(init_length - final_len)/init_length
 
-        print(f"\nFinal MST distance: {final_len}, improvement over initial: {improvement_pct:.2f}%")
-        print(f"Used Steiner points: {len(used_steiner_points)}, total comps used: {total_comps_used}")
-        print(f"Passes used: {passes_used}")
+        logger.info("Final MST distance: %s (%.2f%% improvement over initial); "
+                    "%d Steiner points, %d comps used, %d passes",
+                    final_len, improvement_pct, len(used_steiner_points),
+                    total_comps_used, passes_used)
         # 6) Convert MST to sections (split around T-junctions), detect "natural" Steiner points
         sections = convert_to_sections( grid_resolution,mst_edges, config.cables, config.machines, config.networks, pair_routes, level_name)
 
-        # Build adjacency again to detect T-junctions that might not come from explicit 3/4-term comps
-        mst_adjacency = build_mst_adjacency(mst_edges, pair_routes)
+        # Reuse the cached route-index adjacency to detect T-junctions that
+        # might not come from explicit 3/4-term comps
+        mst_adjacency = _get_route_index(mst_edges, pair_routes).adjacency
         t_junction_points = detect_steiner_points(mst_adjacency)
 
         if t_junction_points:
-            print("🔸 Natural Steiner points (T-junctions):",
-                  [(p.x, p.y) for p in t_junction_points])
-            print("💡 Consider using these as new terminals for further optimisation passes!")
+            logger.debug("Natural Steiner points (T-junctions): %s",
+                         [(p.x, p.y) for p in t_junction_points])
         else:
-            print("🔸 No natural Steiner points detected")
+            logger.debug("No natural Steiner points detected")
 
         # Combine them with used_steiner_points for final reporting
         all_steiner = set(used_steiner_points) | t_junction_points
@@ -1579,7 +1898,7 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
             # --------------------------------------------------------
             # 📏  Cable length sanity-check vs available cable length
             # --------------------------------------------------------
-            expected_len = _parse_length(getattr(cb, "length", None))
+            expected_len = parsed_lengths.get(cid)
             actual_len = max(0, len(final_route) - 1) * grid_resolution
 
             # Calculate theoretical minimum length (Manhattan distance)
@@ -1589,11 +1908,13 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
             if expected_len is not None:
                 if actual_len <= expected_len and (cb.source!="CUS" or cb.target!="CUS"):
                     slack = expected_len - actual_len
-                    print(f"[LENGTH ✅] Cable {cid}: route {actual_len:.2f}m ≤ {expected_len:.2f}m (slack {slack:.2f}m)")
+                    logger.debug("[LENGTH] Cable %s: route %.2fm <= %.2fm (slack %.2fm)",
+                                 cid, actual_len, expected_len, slack)
                 else:
                     over = actual_len - expected_len
                     pct = 100 * over / expected_len
-                    print(f"[LENGTH ❌] Cable {cid}: route {actual_len:.2f}m exceeds {expected_len:.2f}m (+{over:.2f}m, {pct:.1f}% longer)")
+                    logger.info("[LENGTH] Cable %s: route %.2fm exceeds %.2fm (+%.2fm, %.1f%% longer)",
+                                cid, actual_len, expected_len, over, pct)
  
                     # Add to problematic cables
                     problematic_cables.append(ProblematicCable(
@@ -1609,26 +1930,32 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
                     ))
             else:
                 # No specified physical length ➜ just log route
-                print(f"[LENGTH] Cable {cid}: route length {actual_len:.2f}m (no specified max)")
+                logger.debug("[LENGTH] Cable %s: route length %.2fm (no specified max)", cid, actual_len)
 
 
 
         # Build network lookup table for proper network assignment
-        network_lookup = {}
-        for net in config.networks:
-            for func in net.get("functions", []):
-                network_lookup[func] = net["name"]
+        network_lookup = {
+            func: net["name"]
+            for net in config.networks
+            for func in net.get("functions", [])
+        }
 
         cables_in_sections = set()
         for sec in sections:
             cables_in_sections.update(sec.cables)
 
+        # Index cables by id once instead of a linear scan per route
+        cables_by_id = {
+            (c.cableLabel or f"{c.source}-{c.target}"): c for c in config.cables
+        }
+
         # Create sections for cables not in sections
         for cid, route in cable_routes.items():
             if cid in cables_in_sections:
                 continue
 
-            cb = next((c for c in config.cables if (c.cableLabel or f"{c.source}-{c.target}") == cid), None)
+            cb = cables_by_id.get(cid)
             if not cb:
                 continue
 
@@ -1659,17 +1986,12 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
                 strokeWidth=4
             )
             sections.append(sec)
-            print(f"➕ Section added for cable {cid} with {len(route)} points in network '{net_name}'")
-
-        for i in (0,5):
-            for cb in config.cables:
-                cid = cb.cableLabel or f"{cb.source}-{cb.target}"
-                spt = PathPoint(config.machines[cb.source].x, config.machines[cb.source].y)
-                tpt = PathPoint(config.machines[cb.target].x, config.machines[cb.target].y)
-                final_route = find_cable_route(spt, tpt, mst_edges, pair_routes)
-                cable_routes[cid] = final_route
+            logger.debug("Section added for cable %s with %d points in network '%s'",
+                         cid, len(route), net_name)
 
-            sections = [sec for sec in sections if sec.cables]
+        # Routes were already resolved above via the shared route index;
+        # just drop any sections left without cables.
+        sections = [sec for sec in sections if sec.cables]
 
 
 
@@ -1699,8 +2021,7 @@ def _optimize_single_level(config: GridConfig, level_name: str) -> RoutingRespon
         import traceback
         if isinstance(ex, HTTPException):
             raise
-        print("\n=== ERROR in optimize_cable_paths ===")
-        print(traceback.format_exc())
+        logger.error("Error in optimize_cable_paths:\n%s", traceback.format_exc())
         raise HTTPException(500, f"Error: {ex}")
 
 
@@ -1796,8 +2117,7 @@ async def optimize_cable_paths(config: GridConfig) -> RoutingResponse:
 
     except Exception as ex:
         import traceback
-        print("\n=== ERROR in optimize_cable_paths ===")
-        print(traceback.format_exc())
+        logger.error("Error in optimize_cable_paths:\n%s", traceback.format_exc())
         raise HTTPException(500, f"Error: {ex}")
 
 